@@ -3,17 +3,38 @@ Logging Configuration
 
 Sets up structured logging for the application.
 Supports both JSON and text formats.
+
+Uses the stdlib logging module. picologging is not a drop-in replacement:
+it has no hook to take over loggers created via logging.getLogger(), so
+application and third-party (uvicorn, httpx) loggers would bypass it.
+Handler and formatting cost is instead kept off the request path by the
+queue listener below.
 """
 
+import atexit
+import io
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-from typing import Any, Dict
-import json
-from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from datetime import datetime, timezone
+
+import orjson
 
 from config.settings import settings
 
 
+# orjson serializes UTC datetimes with a trailing "Z" (RFC 3339)
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log payload using orjson's C encoder"""
+    return orjson.dumps(data, option=_ORJSON_OPTIONS).decode("utf-8")
+
+
 class JSONFormatter(logging.Formatter):
     """
     Custom JSON formatter for structured logging.
@@ -21,10 +42,19 @@ class JSONFormatter(logging.Formatter):
     Formats log records as JSON for easy parsing by log aggregation tools.
     """
 
+    # Optional context fields copied from the record when set via ``extra=``
+    EXTRA_FIELDS = ("user_id", "request_id", "duration_ms")
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._dumps = _dumps
+        self._extra_keys = self.EXTRA_FIELDS
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # Passed as a datetime so orjson formats it in C
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -35,16 +65,116 @@ class JSONFormatter(logging.Formatter):
             log_data["exception"] = self.formatException(record.exc_info)
 
         # Add extra fields from record
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = record.user_id
+        record_dict = record.__dict__
+        for key in self._extra_keys:
+            value = record_dict.get(key)
+            if value is not None:
+                log_data[key] = value
 
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
+        return self._dumps(log_data)
 
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
 
-        return json.dumps(log_data)
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler for an in-process queue.
+
+    Records never leave the process, so the default preparation (merging
+    args and dropping exc_info for pickling) is skipped and all formatting
+    happens on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that does not flush after every record.
+
+    Writes accumulate in the stream's buffer and are flushed in one syscall
+    by ``flush_buffer``, which the listener calls once the queue drains.
+    """
+
+    def flush(self):
+        pass
+
+    def flush_buffer(self, record: Optional[logging.LogRecord] = None):
+        """
+        Flush buffered writes to the underlying stream.
+
+        Errors (e.g. a closed pipe) go to handleError, as they would inside
+        emit, so they never propagate into the listener thread.
+        """
+        try:
+            super().flush()
+        except Exception:
+            if record is None:
+                record = logging.makeLogRecord({"msg": "Flushing buffered log output"})
+            self.handleError(record)
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes buffered handlers whenever the queue is empty"""
+
+    def handle(self, record: logging.LogRecord):
+        super().handle(record)
+        if self.queue.empty():
+            self.flush_handlers(record)
+
+    def flush_handlers(self, record: Optional[logging.LogRecord] = None):
+        """Flush any BufferedStreamHandler attached to this listener"""
+        for handler in self.handlers:
+            if isinstance(handler, BufferedStreamHandler):
+                handler.flush_buffer(record)
+
+
+# Levels for noisy third-party loggers; settings.LOG_NOISY_LIBRARIES
+# entries are merged over these
+DEFAULT_NOISY_LIBRARIES = {
+    "httpx": "WARNING",
+    "httpcore": "WARNING",
+    "openai": "INFO"
+}
+
+# Size of the stdout write buffer used in production. Flushes of this size
+# exceed PIPE_BUF, so they are not atomic on a pipe (see _create_stream_handler).
+STDOUT_BUFFER_SIZE = 64 * 1024
+
+# Background listener that writes queued records to stdout
+_listener: Optional[BatchingQueueListener] = None
+
+
+def _create_stream_handler() -> logging.StreamHandler:
+    """
+    Create the stdout handler used by the log listener.
+
+    In production, writes go through a 64KB buffer so bursts of records are
+    coalesced into a single write syscall. Development keeps the default
+    per-record flush so output shows up immediately.
+
+    Limitation: a flush larger than PIPE_BUF (4KB on Linux) is not atomic,
+    and flushes do not end on line boundaries. If several worker processes
+    share one stdout pipe, JSON lines from different workers can
+    interleave, so give each process its own stdout (e.g. one process per
+    container).
+    """
+    if settings.ENVIRONMENT != "production":
+        return logging.StreamHandler(sys.stdout)
+
+    try:
+        stdout_fd = sys.stdout.fileno()
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        return logging.StreamHandler(sys.stdout)
+
+    # closefd=False keeps the process's stdout open when this stream is closed
+    stream = open(
+        stdout_fd,
+        "w",
+        buffering=STDOUT_BUFFER_SIZE,
+        encoding=sys.stdout.encoding or "utf-8",
+        closefd=False
+    )
+    return BufferedStreamHandler(stream)
 
 
 def setup_logging():
@@ -52,12 +182,23 @@ def setup_logging():
     Configure logging for the application.
 
     Uses JSON format in production, text format in development.
+    Records are enqueued by the root logger and written to stdout by a
+    QueueListener thread, so request handlers never block on I/O.
+
+    Safe to call more than once: later calls are no-ops while the listener
+    thread is running, and start a new listener after shutdown_logging(),
+    after a fork, or if the thread has died.
     """
+    global _listener
+
+    if _listener_running():
+        return
+
     # Determine log level
     log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
 
     # Create handler
-    handler = logging.StreamHandler(sys.stdout)
+    handler = _create_stream_handler()
 
     # Set formatter based on environment
     if settings.LOG_FORMAT == "json":
@@ -70,17 +211,112 @@ def setup_logging():
 
     handler.setFormatter(formatter)
 
+    # Hand records off to a background writer thread
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = BatchingQueueListener(
+        log_queue, handler, respect_handler_level=True
+    )
+    _listener.start()
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     root_logger.handlers = []  # Clear existing handlers
-    root_logger.addHandler(handler)
+    root_logger.addHandler(LocalQueueHandler(log_queue))
 
     # Reduce noise from third-party libraries
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
-    logging.getLogger("openai").setLevel(logging.INFO)
+    noisy_libraries = {**DEFAULT_NOISY_LIBRARIES, **settings.LOG_NOISY_LIBRARIES}
+    for library, level in noisy_libraries.items():
+        # setLevel rejects unknown level names instead of silently defaulting
+        logging.getLogger(library).setLevel(level.upper())
 
     # Log initialization
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging initialized (level={settings.LOG_LEVEL}, format={settings.LOG_FORMAT})")
+    logger.info(
+        "Logging initialized (level=%s, format=%s)",
+        settings.LOG_LEVEL,
+        settings.LOG_FORMAT
+    )
+
+
+def _synchronous_handler(handler: logging.Handler) -> logging.Handler:
+    """Return a handler that writes immediately, replacing buffered ones"""
+    if not isinstance(handler, BufferedStreamHandler):
+        return handler
+
+    fallback = logging.StreamHandler(sys.stdout)
+    fallback.setLevel(handler.level)
+    fallback.setFormatter(handler.formatter)
+    return fallback
+
+
+def _listener_running() -> bool:
+    """Check whether the background listener thread is alive"""
+    thread = getattr(_listener, "_thread", None)
+    return thread is not None and thread.is_alive()
+
+
+def _use_synchronous_handlers(handlers: Tuple[logging.Handler, ...]):
+    """Replace the root logger's queue handler with direct stdout handlers"""
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, LocalQueueHandler):
+            root_logger.removeHandler(handler)
+    for handler in handlers:
+        root_logger.addHandler(_synchronous_handler(handler))
+
+
+def shutdown_logging():
+    """
+    Stop the background log listener.
+
+    Writes out any queued and buffered records before returning, then
+    attaches the stdout handler directly to the root logger so records
+    logged after shutdown are still written (synchronously). Called on
+    application shutdown and at interpreter exit.
+    """
+    global _listener
+    if _listener is None:
+        return
+
+    if _listener_running():
+        _listener.stop()
+    _listener.flush_handlers()
+    _use_synchronous_handlers(_listener.handlers)
+    _listener = None
+
+
+def _before_fork():
+    """Flush and hold the listener's handlers so the child inherits empty buffers"""
+    if _listener is not None:
+        for handler in _listener.handlers:
+            handler.acquire()
+        _listener.flush_handlers()
+
+
+def _after_fork_in_parent():
+    if _listener is not None:
+        for handler in _listener.handlers:
+            handler.release()
+
+
+def _after_fork_in_child():
+    """
+    The listener thread does not survive a fork.
+
+    Fall back to synchronous logging in the child until setup_logging()
+    starts a listener of its own (e.g. from the FastAPI lifespan).
+    """
+    global _listener
+    if _listener is not None:
+        _use_synchronous_handlers(_listener.handlers)
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_in_parent,
+        after_in_child=_after_fork_in_child
+    )
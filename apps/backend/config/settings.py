@@ -6,9 +6,57 @@ Follows 12-factor app principles for configuration management.
 """
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from functools import cached_property, lru_cache
+from typing import Dict, List
 import os
-import json
+import orjson
+
+
+# Shared env loading behaviour for all settings classes
+ENV_SETTINGS_CONFIG = SettingsConfigDict(
+    env_file=".env",
+    env_file_encoding="utf-8",
+    case_sensitive=True,
+    extra="ignore"
+)
+
+
+class SupabaseSettings(BaseSettings):
+    """Supabase credentials, loaded on first use"""
+
+    SUPABASE_URL: str
+    SUPABASE_ANON_KEY: str  # Public key - safe for frontend
+    SUPABASE_SERVICE_ROLE_KEY: str  # Bypasses RLS - server-side only, NEVER expose to frontend
+
+    model_config = ENV_SETTINGS_CONFIG
+
+
+class OpenAISettings(BaseSettings):
+    """OpenAI credentials and model defaults, loaded on first use"""
+
+    OPENAI_API_KEY: str
+    OPENAI_MODEL: str = "gpt-4o"
+    OPENAI_WHISPER_MODEL: str = "whisper-1"
+    OPENAI_MAX_TOKENS: int = 4000
+    OPENAI_TEMPERATURE: float = 0.7
+
+    model_config = ENV_SETTINGS_CONFIG
+
+
+class GoogleSettings(BaseSettings):
+    """Google Cloud credentials (for Google Slides API), loaded on first use"""
+
+    GOOGLE_SERVICE_ACCOUNT_KEY: str  # JSON string
+
+    model_config = ENV_SETTINGS_CONFIG
+
+    @cached_property
+    def credentials_dict(self) -> dict:
+        """Parse Google service account key from JSON string (parsed once)"""
+        try:
+            return orjson.loads(self.GOOGLE_SERVICE_ACCOUNT_KEY)
+        except orjson.JSONDecodeError:
+            raise ValueError("Invalid GOOGLE_SERVICE_ACCOUNT_KEY JSON")
 
 
 class Settings(BaseSettings):
@@ -16,6 +64,9 @@ class Settings(BaseSettings):
     Application settings loaded from environment variables.
 
     All sensitive values should be stored in .env file, never committed to git.
+    Subsystem credentials (Supabase, OpenAI, Google) are read and validated
+    the first time they are accessed, so processes that never touch a
+    subsystem do not pay for (or fail on) its configuration.
     """
 
     # ========================================================================
@@ -27,51 +78,27 @@ class Settings(BaseSettings):
     API_URL: str = "http://localhost:8000"
 
     # ========================================================================
-    # SUPABASE
+    # SUBSYSTEMS (lazily loaded)
     # ========================================================================
-    SUPABASE_URL: str
-    SUPABASE_ANON_KEY: str
-    SUPABASE_SERVICE_ROLE_KEY: str
+    @cached_property
+    def supabase(self) -> SupabaseSettings:
+        """Supabase settings"""
+        return SupabaseSettings()
 
-    @property
-    def supabase_url(self) -> str:
-        """Supabase project URL"""
-        return self.SUPABASE_URL
+    @cached_property
+    def openai(self) -> OpenAISettings:
+        """OpenAI settings"""
+        return OpenAISettings()
 
-    @property
-    def supabase_anon_key(self) -> str:
-        """Supabase anonymous (public) key - safe for frontend"""
-        return self.SUPABASE_ANON_KEY
-
-    @property
-    def supabase_service_role_key(self) -> str:
-        """
-        Supabase service role key - bypasses RLS, server-side only!
-        NEVER expose to frontend.
-        """
-        return self.SUPABASE_SERVICE_ROLE_KEY
-
-    # ========================================================================
-    # OPENAI
-    # ========================================================================
-    OPENAI_API_KEY: str
-    OPENAI_MODEL: str = "gpt-4o"
-    OPENAI_WHISPER_MODEL: str = "whisper-1"
-    OPENAI_MAX_TOKENS: int = 4000
-    OPENAI_TEMPERATURE: float = 0.7
-
-    # ========================================================================
-    # GOOGLE CLOUD (for Google Slides API)
-    # ========================================================================
-    GOOGLE_SERVICE_ACCOUNT_KEY: str  # JSON string
+    @cached_property
+    def google(self) -> GoogleSettings:
+        """Google Cloud settings"""
+        return GoogleSettings()
 
     @property
     def google_credentials_dict(self) -> dict:
-        """Parse Google service account key from JSON string"""
-        try:
-            return json.loads(self.GOOGLE_SERVICE_ACCOUNT_KEY)
-        except json.JSONDecodeError:
-            raise ValueError("Invalid GOOGLE_SERVICE_ACCOUNT_KEY JSON")
+        """Parsed Google service account key"""
+        return self.google.credentials_dict
 
     # ========================================================================
     # EMAIL
@@ -129,16 +156,14 @@ class Settings(BaseSettings):
     # ========================================================================
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"  # json or text
+    # Extra per-library log levels (JSON object in env), merged over the
+    # built-in defaults in logging_config.DEFAULT_NOISY_LIBRARIES
+    LOG_NOISY_LIBRARIES: Dict[str, str] = {}
 
     # ========================================================================
     # PYDANTIC SETTINGS
     # ========================================================================
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=True,
-        extra="ignore"
-    )
+    model_config = ENV_SETTINGS_CONFIG
 
 
 # Create global settings instance
@@ -149,12 +174,14 @@ settings = Settings()
 # HELPER FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=1)
 def get_cors_origins() -> List[str]:
     """
     Get CORS origins based on environment.
 
     In production, this should be restricted to actual domains.
     In development, allows localhost.
+    Computed once; settings do not change after startup.
     """
     if settings.ENVIRONMENT == "production":
         return [
@@ -0,0 +1,6 @@
+"""
+Pytest configuration for the backend.
+
+Lives at the backend root so pytest puts this directory on sys.path and
+tests can import ``config``, ``middleware`` and ``utils`` like main.py does.
+"""
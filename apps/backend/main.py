@@ -9,12 +9,13 @@ Architecture: Three-tier MVC with dependency injection
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette_compress import CompressMiddleware
 from contextlib import asynccontextmanager
 import logging
 
 from config.settings import settings
-from config.logging_config import setup_logging
+from config.logging_config import setup_logging, shutdown_logging
 from middleware.auth_middleware import AuthMiddleware
 from middleware.error_middleware import setup_error_handlers
 from middleware.logging_middleware import LoggingMiddleware
@@ -42,10 +43,13 @@ async def lifespan(app: FastAPI):
     Application lifespan context manager.
     Handles startup and shutdown events.
     """
-    # Startup
+    # Startup (no-op unless a previous shutdown stopped the log listener)
+    setup_logging()
     logger.info("🚀 Starting SlideBanai API...")
-    logger.info(f"Environment: {settings.ENVIRONMENT}")
-    logger.info(f"Debug mode: {settings.DEBUG}")
+    logger.info("Environment: %s", settings.ENVIRONMENT)
+    logger.info("Debug mode: %s", settings.DEBUG)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("CORS origins: %s", ", ".join(settings.CORS_ORIGINS))
 
     # Initialize external services
     from factories.supabase_factory import SupabaseClientFactory
@@ -61,13 +65,14 @@ async def lifespan(app: FastAPI):
         logger.info("✅ OpenAI client initialized")
 
     except Exception as e:
-        logger.error(f"❌ Service initialization failed: {str(e)}")
+        logger.error("❌ Service initialization failed: %s", e)
         raise
 
     yield
 
     # Shutdown
     logger.info("🛑 Shutting down SlideBanai API...")
+    shutdown_logging()
 
 
 # Initialize FastAPI app
@@ -78,6 +83,7 @@ app = FastAPI(
     docs_url="/api/v1/docs",
     redoc_url="/api/v1/redoc",
     openapi_url="/api/v1/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -86,17 +92,20 @@ app = FastAPI(
 # ============================================================================
 
 # 1. CORS - Must be first
+# A frozenset makes the per-request origin check a hash lookup
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
+    allow_origins=frozenset(settings.CORS_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Request-ID"],
     expose_headers=["*"]
 )
 
-# 2. GZip compression
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# 2. Compression (zstd/brotli/gzip, negotiated via Accept-Encoding).
+# Small responses fit in a single TCP segment and are sent uncompressed.
+COMPRESSION_MINIMUM_SIZE = 4096
+app.add_middleware(CompressMiddleware, minimum_size=COMPRESSION_MINIMUM_SIZE)
 
 # 3. Custom logging middleware
 app.add_middleware(LoggingMiddleware)
@@ -6,19 +6,26 @@ Implements proper HTTP status codes and error formats.
 """
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 import logging
-from datetime import datetime
+import orjson
 from typing import Union
 
+from config.settings import is_production
+from utils.time_utils import utc_now_iso
+
 logger = logging.getLogger(__name__)
 
 
 class APIError(Exception):
     """Base exception for API errors"""
 
+    # No __slots__: BaseException instances keep a __dict__ regardless, and
+    # BaseException.__reduce__ only restores args and __dict__, so slot
+    # values would be lost on copy/pickle.
+
     def __init__(
         self,
         message: str,
@@ -129,41 +136,82 @@ class InsufficientCreditsException(APIError):
         )
 
 
+def _format_error_location(loc: tuple) -> str:
+    """Join a validation error location into a dotted field path"""
+    if all(type(part) is str for part in loc):
+        return ".".join(loc)
+    return ".".join(map(str, loc))
+
+
 def create_error_response(
     code: str,
     message: str,
     status_code: int,
     details: dict = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create standardized error response"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "error": {
                 "code": code,
                 "message": message,
                 "details": details or {},
-                "timestamp": datetime.utcnow().isoformat() + "Z"
+                "timestamp": utc_now_iso()
             }
         }
     )
 
 
+def _prerender_error_prefix(code: str, message: str) -> bytes:
+    """
+    Serialize an error body with empty details, up to the timestamp value.
+
+    Appending the timestamp and _PRERENDERED_SUFFIX yields the same JSON
+    as create_error_response.
+    """
+    body = orjson.dumps({"error": {"code": code, "message": message, "details": {}}})
+    return body[:-2] + b',"timestamp":"'
+
+
+_PRERENDERED_SUFFIX = b'"}}'
+
+# Pre-serialized bodies for the most frequent error shapes, keyed by (code, message)
+_PRERENDERED_ERRORS = {
+    (exc.code, exc.message): _prerender_error_prefix(exc.code, exc.message)
+    for exc in (AuthenticationException(), RateLimitException())
+}
+
+
 def setup_error_handlers(app: FastAPI):
     """
     Register global error handlers for the FastAPI app.
 
     This ensures all errors return consistent JSON responses.
     """
+    # Captured by the handlers below; the environment is fixed at startup
+    is_prod = is_production()
 
     @app.exception_handler(APIError)
     async def api_error_handler(request: Request, exc: APIError):
         """Handle custom API errors"""
         logger.error(
-            f"API Error: {exc.code} - {exc.message}",
+            "API Error: %s - %s",
+            exc.code,
+            exc.message,
             extra={"code": exc.code, "details": exc.details}
         )
 
+        # Fast path: default 401/429 errors reuse a pre-serialized body
+        if not exc.details:
+            prefix = _PRERENDERED_ERRORS.get((exc.code, exc.message))
+            if prefix is not None:
+                return Response(
+                    content=prefix + utc_now_iso().encode() + _PRERENDERED_SUFFIX,
+                    status_code=exc.status_code,
+                    media_type="application/json"
+                )
+
         return create_error_response(
             code=exc.code,
             message=exc.message,
@@ -174,15 +222,16 @@ def setup_error_handlers(app: FastAPI):
     @app.exception_handler(RequestValidationError)
     async def validation_error_handler(request: Request, exc: RequestValidationError):
         """Handle Pydantic validation errors"""
-        errors = []
-        for error in exc.errors():
-            errors.append({
-                "field": ".".join(str(loc) for loc in error["loc"]),
+        errors = [
+            {
+                "field": _format_error_location(error["loc"]),
                 "message": error["msg"],
                 "type": error["type"]
-            })
+            }
+            for error in exc.errors()
+        ]
 
-        logger.warning(f"Validation error: {errors}")
+        logger.warning("Validation error: %s", errors)
 
         return create_error_response(
             code="VALIDATION_ERROR",
@@ -197,8 +246,7 @@ def setup_error_handlers(app: FastAPI):
         logger.exception("Unhandled exception occurred")
 
         # Don't expose internal errors in production
-        from config.settings import settings
-        if settings.ENVIRONMENT == "production":
+        if is_prod:
             message = "An internal error occurred"
         else:
             message = str(exc)
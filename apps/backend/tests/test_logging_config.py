@@ -0,0 +1,68 @@
+"""
+Tests for the queued/buffered logging pipeline in config.logging_config.
+"""
+
+import io
+import logging
+import queue
+import time
+
+from config import logging_config
+from config.logging_config import BatchingQueueListener, BufferedStreamHandler
+
+
+class BrokenPipeStream(io.StringIO):
+    """Stream whose flush fails the way a closed stdout pipe does"""
+
+    def flush(self):
+        raise BrokenPipeError(32, "Broken pipe")
+
+
+def test_flush_error_does_not_kill_listener_thread():
+    handler = BufferedStreamHandler(BrokenPipeStream())
+    handled_errors = []
+    handler.handleError = handled_errors.append
+
+    log_queue = queue.SimpleQueue()
+    listener = BatchingQueueListener(log_queue, handler)
+    listener.start()
+    try:
+        # The queue drains after the first record, triggering a failing flush
+        log_queue.put(logging.makeLogRecord({"msg": "first"}))
+        deadline = time.monotonic() + 2
+        while not handled_errors and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert handled_errors
+
+        log_queue.put(logging.makeLogRecord({"msg": "second"}))
+    finally:
+        # stop() drains the queue; a dead thread would leave records behind
+        listener.stop()
+
+    assert log_queue.empty()
+    assert handler.stream.getvalue() == "first\nsecond\n"
+
+
+def test_flush_handlers_without_record_reports_error():
+    handler = BufferedStreamHandler(BrokenPipeStream())
+    handled_errors = []
+    handler.handleError = handled_errors.append
+
+    listener = BatchingQueueListener(queue.SimpleQueue(), handler)
+    listener.flush_handlers()
+
+    assert len(handled_errors) == 1
+    assert isinstance(handled_errors[0], logging.LogRecord)
+
+
+def test_setup_logging_restarts_dead_listener():
+    logging_config.setup_logging()
+    try:
+        # Simulate the thread dying (or not surviving a fork)
+        logging_config._listener.stop()
+        assert not logging_config._listener_running()
+
+        logging_config.setup_logging()
+        assert logging_config._listener_running()
+    finally:
+        logging_config.shutdown_logging()
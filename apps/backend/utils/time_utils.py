@@ -0,0 +1,27 @@
+"""
+Time Utilities
+
+Fast ISO 8601 UTC timestamp formatting for API responses.
+"""
+
+import time
+
+# (second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted second.
+# Stored as one tuple so concurrent readers never see a torn update.
+_second_cache = (-1, "")
+
+
+def _format(seconds: int, microseconds: int) -> str:
+    """Format whole seconds plus microseconds, reusing the cached prefix"""
+    global _second_cache
+    cached_seconds, prefix = _second_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _second_cache = (seconds, prefix)
+    return f"{prefix}.{microseconds:06d}Z"
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as ISO 8601 with microseconds and a trailing Z"""
+    ns = time.time_ns()
+    return _format(ns // 1_000_000_000, (ns // 1000) % 1_000_000)